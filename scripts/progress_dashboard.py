@@ -1,76 +1,210 @@
 #!/usr/bin/env python3
 import curses
 import os
+import selectors
+import sys
 import textwrap
 import time
+import unicodedata
 from dataclasses import dataclass
+from operator import attrgetter
 
 try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover - Python < 3.11
-    import tomli as tomllib
+    import fasttoml as _toml
+except ImportError:
+    try:
+        import tomllib as _toml
+    except ModuleNotFoundError:  # pragma: no cover - Python < 3.11
+        import tomli as _toml
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ModuleNotFoundError:
+    INotify = None
 
 
 REFRESH_SECONDS = 10
 PROGRESS_PATH = "PROGRESS.toml"
+TS_WIDTH = 20
+TYPE_WIDTH = 10
+ROW_FORMAT = "%s  %s  %s"
+
+_CONTROL_CHARS = {code: " " for code in (*range(32), 127)}
+
+_display_cache: dict[int, list[str]] = {}
+_detail_cache: dict[tuple[int, int], list[str]] = {}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     ts: str
     type: str
     task: str
-    raw: dict
+    raw: dict[str, object]
 
 
-def load_events(path: str) -> list[Event]:
+def load_events(path: str) -> tuple[list[Event], float]:
     with open(path, "rb") as handle:
-        data = tomllib.load(handle)
+        mtime = os.fstat(handle.fileno()).st_mtime
+        data = _toml.load(handle)
     events = []
     for item in data.get("events", []):
         ts = str(item.get("ts", ""))
         event_type = str(item.get("type", ""))
         task = item.get("task") or item.get("summary") or "(no task)"
         events.append(Event(ts=ts, type=event_type, task=str(task), raw=item))
-    events.sort(key=lambda ev: ev.ts, reverse=True)
-    return events
+    events.sort(key=attrgetter("ts"), reverse=True)
+    return events, mtime
+
+
+def watch_progress_file() -> "INotify | None":
+    if INotify is None:
+        return None
+    try:
+        watcher = INotify()
+        watcher.add_watch(
+            os.path.dirname(PROGRESS_PATH) or ".",
+            inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO,
+        )
+    except (AttributeError, OSError):
+        return None
+    return watcher
+
+
+def progress_file_changed(watcher: "INotify") -> bool:
+    name = os.path.basename(PROGRESS_PATH)
+    return any(event.name == name for event in watcher.read(timeout=0))
 
 
 def clamp(value: int, low: int, high: int) -> int:
     return max(low, min(high, value))
 
 
+def char_width(char: str) -> int:
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def text_width(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    return sum(char_width(char) for char in text)
+
+
+def fit(text: str, width: int) -> str:
+    if text.isascii():
+        return text[: max(0, width)]
+    used = 0
+    for idx, char in enumerate(text):
+        used += char_width(char)
+        if used > width:
+            return text[:idx]
+    return text
+
+
+def pad(text: str, width: int) -> str:
+    return text + " " * (width - text_width(text))
+
+
 def clip(text: str, width: int) -> str:
-    if width <= 0:
-        return ""
-    if len(text) <= width:
+    if text_width(text) <= width:
         return text
     if width <= 1:
-        return text[:width]
-    return text[: width - 1] + "…"
+        return fit(text, width)
+    return fit(text, width - 1) + "…"
+
+
+def wrap(text: str, width: int) -> list[str]:
+    lines = []
+    for line in textwrap.wrap(text, width=width):
+        while text_width(line) > width:
+            head = fit(line, width) or line[:1]
+            lines.append(head)
+            line = line[len(head) :]
+        lines.append(line)
+    return lines
+
+
+def display_rows(events: list[Event], width: int) -> list[str]:
+    rows = _display_cache.get(width)
+    if rows is None:
+        task_width = max(1, width - TS_WIDTH - TYPE_WIDTH - 4)
+        rows = [
+            ROW_FORMAT
+            % (
+                pad(clip(event.ts, TS_WIDTH), TS_WIDTH),
+                pad(clip(event.type, TYPE_WIDTH), TYPE_WIDTH),
+                clip(event.task, task_width),
+            )
+            for event in events
+        ]
+        _display_cache[width] = rows
+    return rows
+
+
+def single_line(text: str) -> str:
+    return text.translate(_CONTROL_CHARS)
+
+
+def put_line(stdscr: curses.window, row: int, text: str, width: int, attr: int = 0) -> None:
+    stdscr.addstr(row, 0, fit(single_line(text), width - 1), attr)
+    stdscr.clrtoeol()
 
 
-def format_field_value(value) -> list[str]:
+def put_block(stdscr: curses.window, row: int, lines: list[str], width: int) -> None:
+    for offset, line in enumerate(lines):
+        put_line(stdscr, row + offset, line, width)
+
+
+def synchronized_output() -> tuple[bytes, bytes] | None:
+    sync = curses.tigetstr("Sync")
+    if not sync:
+        return None
+    return curses.tparm(sync, 1), curses.tparm(sync, 2)
+
+
+def flush_frame(sync: tuple[bytes, bytes] | None) -> None:
+    if sync is None:
+        curses.doupdate()
+        return
+    begin, end = sync
+    os.write(sys.stdout.fileno(), begin)
+    curses.doupdate()
+    os.write(sys.stdout.fileno(), end)
+
+
+def format_field_value(value: object, width: int = 76) -> list[str]:
     if isinstance(value, list):
         lines = []
         for item in value:
-            for wrapped in textwrap.wrap(str(item), width=76):
-                prefix = "- " if not lines or lines[-1].startswith("- ") else "  "
-                lines.append(prefix + wrapped)
+            chunks = wrap(str(item), max(1, width - 2)) or [""]
+            lines.append("- " + chunks[0])
+            for chunk in chunks[1:]:
+                lines.append("  " + chunk)
         return lines or ["- (empty)"]
     if isinstance(value, dict):
         lines = []
         for key, val in value.items():
-            lines.append(f"{key}: {val}")
+            lines.extend(wrap(f"{key}: {val}", width))
         return lines or ["(empty)"]
     if value is None:
         return ["(none)"]
-    wrapped = textwrap.wrap(str(value), width=76) or [""]
+    wrapped = wrap(str(value), width) or [""]
     return wrapped
 
 
+def format_status_line(last_loaded_at: float | None, last_status: str) -> str:
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    if last_loaded_at:
+        last_loaded = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_loaded_at))
+    else:
+        last_loaded = "never"
+    return f"Now: {timestamp} | Last reload: {last_loaded} | Status: {last_status}"
+
+
 def render_list(
-    stdscr,
+    stdscr: curses.window,
     events: list[Event],
     selected: int,
     scroll_top: int,
@@ -78,7 +212,7 @@ def render_list(
     last_loaded_at: float | None,
     last_changed_at: float | None,
     last_status: str,
-):
+) -> None:
     height, width = stdscr.getmaxyx()
     if last_changed_at:
         changed_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_changed_at))
@@ -88,77 +222,68 @@ def render_list(
         f"PROGRESS dashboard | {PROGRESS_PATH} | refresh {REFRESH_SECONDS}s | "
         f"last update {changed_at}"
     )
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    stdscr.addnstr(0, 0, header, width - 1)
-    if last_loaded_at:
-        last_loaded = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_loaded_at))
-    else:
-        last_loaded = "never"
-    status_line = f"Now: {timestamp} | Last reload: {last_loaded} | Status: {last_status}"
-    stdscr.addnstr(1, 0, status_line, width - 1)
+    status_line = format_status_line(last_loaded_at, last_status)
+    put_block(stdscr, 0, [header, status_line], width)
     stdscr.hline(2, 0, "-", width)
     visible_rows = max(1, height - 4)
 
-    ts_width = 20
-    type_width = 10
-    task_width = max(1, width - ts_width - type_width - 4)
     start = scroll_top
     end = min(len(events), scroll_top + visible_rows)
-    for idx in range(start, end):
-        row = 3 + (idx - start)
-        event = events[idx]
-        ts = clip(event.ts, ts_width)
-        etype = clip(event.type, type_width)
-        task = clip(event.task, task_width)
-        line = f"{ts:<{ts_width}}  {etype:<{type_width}}  {task}"
-        if idx == selected:
-            stdscr.attron(curses.A_REVERSE)
-            stdscr.addnstr(row, 0, line, width - 1)
-            stdscr.attroff(curses.A_REVERSE)
-        else:
-            stdscr.addnstr(row, 0, line, width - 1)
+    rows = display_rows(events, width)[start:end]
+    cursor = selected - start
+    put_block(stdscr, 3, rows[:cursor], width)
+    if 0 <= cursor < len(rows):
+        put_line(stdscr, 3 + cursor, rows[cursor], width, curses.A_REVERSE)
+        put_block(stdscr, 4 + cursor, rows[cursor + 1 :], width)
+    stdscr.move(3 + (end - start), 0)
+    stdscr.clrtobot()
 
     footer = "Up/Down: select  Enter: details  Esc: quit"
     stdscr.hline(height - 1, 0, "-", width)
     stdscr.addnstr(height - 1, 0, footer, width - 1)
 
 
-def render_detail(stdscr, event: Event, scroll: int):
-    height, width = stdscr.getmaxyx()
-    title = f"Event detail | {event.ts} | {event.type}"
-    stdscr.addnstr(0, 0, title, width - 1)
-    stdscr.hline(1, 0, "-", width)
-
-    lines: list[str] = []
+def build_detail_lines(event: Event, width: int) -> list[str]:
+    lines = _detail_cache.get((id(event), width))
+    if lines is not None:
+        return lines
+    lines = []
+    wrap_width = max(1, min(76, width - 4))
     fields_order = ["task", "summary", "details", "challenges", "solutions", "decisions", "tests", "files"]
     used = set()
     for field in fields_order:
         if field in event.raw:
             used.add(field)
             lines.append(field.upper())
-            for wrapped in format_field_value(event.raw[field]):
-                for segment in textwrap.wrap(wrapped, width=width - 4):
-                    lines.append(f"  {segment}")
+            for wrapped in format_field_value(event.raw[field], wrap_width):
+                lines.append(f"  {wrapped}")
             lines.append("")
     for field, value in event.raw.items():
         if field in used or field in ("ts", "type"):
             continue
         lines.append(field.upper())
-        for wrapped in format_field_value(value):
-            for segment in textwrap.wrap(wrapped, width=width - 4):
-                lines.append(f"  {segment}")
+        for wrapped in format_field_value(value, wrap_width):
+            lines.append(f"  {wrapped}")
         lines.append("")
 
     if not lines:
         lines = ["(no details)"]
+    _detail_cache[(id(event), width)] = lines
+    return lines
+
+
+def render_detail(stdscr: curses.window, event: Event, lines: list[str], scroll: int) -> int:
+    height, width = stdscr.getmaxyx()
+    title = f"Event detail | {event.ts} | {event.type}"
+    put_line(stdscr, 0, title, width)
+    stdscr.hline(1, 0, "-", width)
 
     visible_rows = max(1, height - 3)
     scroll = clamp(scroll, 0, max(0, len(lines) - visible_rows))
-    for i in range(visible_rows):
-        idx = scroll + i
-        if idx >= len(lines):
-            break
-        stdscr.addnstr(2 + i, 0, lines[idx], width - 1)
+    shown = lines[scroll : scroll + visible_rows]
+    put_block(stdscr, 2, shown, width)
+    stdscr.move(2 + len(shown), 0)
+    stdscr.clrtobot()
 
     footer = "Esc: back  Up/Down: scroll"
     stdscr.hline(height - 1, 0, "-", width)
@@ -166,81 +291,111 @@ def render_detail(stdscr, event: Event, scroll: int):
     return scroll
 
 
-def adjust_scroll(selected: int, scroll_top: int, visible_rows: int, total: int) -> int:
+def adjust_scroll(selected: int, visible_rows: int, total: int) -> int:
     if total <= visible_rows:
         return 0
-    middle = visible_rows // 2
-    max_scroll = max(0, total - visible_rows)
-    if selected >= scroll_top + middle and scroll_top < max_scroll:
-        scroll_top = clamp(selected - middle, 0, max_scroll)
-    if selected < scroll_top + middle and scroll_top > 0:
-        scroll_top = clamp(selected - middle, 0, max_scroll)
-    if selected >= total - 1:
-        scroll_top = max_scroll
-    return scroll_top
-
-
-def main(stdscr):
+    return clamp(selected - visible_rows // 2, 0, total - visible_rows)
+
+
+def main(stdscr: curses.window) -> None:
     curses.curs_set(0)
-    stdscr.timeout(100)
+    stdscr.nodelay(True)
+    sync = synchronized_output()
+    selector = selectors.DefaultSelector()
+    selector.register(sys.stdin, selectors.EVENT_READ)
+    watcher = watch_progress_file()
+    if watcher is not None:
+        selector.register(watcher, selectors.EVENT_READ)
+    reload_requested = False
     selected = 0
     scroll_top = 0
     detail_mode = False
     detail_scroll = 0
+    detail_lines = None
     last_load = 0.0
     last_loaded_at = None
     last_changed_at = None
     last_status = "waiting"
     events: list[Event] = []
     last_mtime = None
+    last_clock_second = None
+    dirty = True
 
     while True:
         now = time.monotonic()
-        if now - last_load >= REFRESH_SECONDS:
+        if reload_requested or now - last_load >= REFRESH_SECONDS:
             try:
-                mtime = os.path.getmtime(PROGRESS_PATH)
+                mtime = os.stat(PROGRESS_PATH).st_mtime
             except FileNotFoundError:
                 mtime = None
-            try:
-                events = load_events(PROGRESS_PATH)
+            if not reload_requested and mtime is not None and mtime == last_mtime:
                 last_loaded_at = time.time()
-                if mtime != last_mtime:
+                last_status = "loaded (unchanged)"
+            else:
+                try:
+                    events, last_mtime = load_events(PROGRESS_PATH)
+                    last_loaded_at = time.time()
                     last_status = "loaded"
                     last_changed_at = last_loaded_at
-                else:
-                    last_status = "loaded (unchanged)"
-            except FileNotFoundError:
-                events = []
-                last_status = "not found"
-            except Exception:
-                events = []
-                last_status = "load error"
-            last_mtime = mtime
-            selected = clamp(selected, 0, max(0, len(events) - 1))
-            detail_scroll = 0
+                except FileNotFoundError:
+                    events = []
+                    last_status = "not found"
+                    last_mtime = None
+                except Exception:
+                    events = []
+                    last_status = "load error"
+                    last_mtime = None
+                _display_cache.clear()
+                _detail_cache.clear()
+                selected = clamp(selected, 0, max(0, len(events) - 1))
+                detail_scroll = 0
+                detail_lines = None
             last_load = now
-
-        stdscr.erase()
-        if detail_mode and events:
-            detail_scroll = render_detail(stdscr, events[selected], detail_scroll)
-        else:
-            height, _ = stdscr.getmaxyx()
-            visible_rows = max(1, height - 4)
-            scroll_top = adjust_scroll(selected, scroll_top, visible_rows, len(events))
-            render_list(
-                stdscr,
-                events,
-                selected,
-                scroll_top,
-                last_load,
-                last_loaded_at,
-                last_changed_at,
-                last_status,
-            )
-        stdscr.refresh()
+            reload_requested = False
+            dirty = True
+
+        clock_second = int(time.time())
+        clock_tick = clock_second != last_clock_second and not (detail_mode and events)
+        last_clock_second = clock_second
+
+        if dirty:
+            if detail_mode and events:
+                if detail_lines is None:
+                    _, width = stdscr.getmaxyx()
+                    detail_lines = build_detail_lines(events[selected], width)
+                detail_scroll = render_detail(stdscr, events[selected], detail_lines, detail_scroll)
+            else:
+                height, _ = stdscr.getmaxyx()
+                visible_rows = max(1, height - 4)
+                scroll_top = adjust_scroll(selected, visible_rows, len(events))
+                render_list(
+                    stdscr,
+                    events,
+                    selected,
+                    scroll_top,
+                    last_load,
+                    last_loaded_at,
+                    last_changed_at,
+                    last_status,
+                )
+        elif clock_tick:
+            _, width = stdscr.getmaxyx()
+            put_line(stdscr, 1, format_status_line(last_loaded_at, last_status), width)
+        if dirty or clock_tick:
+            stdscr.noutrefresh()
+            flush_frame(sync)
+            dirty = False
 
         key = stdscr.getch()
         if key == -1:
+            timeout = max(0.0, last_load + REFRESH_SECONDS - time.monotonic())
+            for ready, _ in selector.select(min(timeout, 1 - time.time() % 1)):
+                if ready.fileobj is watcher and progress_file_changed(watcher):
+                    reload_requested = True
+            continue
+        dirty = True
+        if key == curses.KEY_RESIZE:
+            detail_lines = None
             continue
         if detail_mode:
             if key in (27, ord("q")):
@@ -262,6 +417,7 @@ def main(stdscr):
             if events:
                 detail_mode = True
                 detail_scroll = 0
+                detail_lines = None
 
 
 if __name__ == "__main__":